@@ -4,6 +4,7 @@ import sys
 from argparse import ArgumentParser
 from os.path import abspath
 from shutil import rmtree
+from typing import Dict
 from typing import List
 
 import jinja2
@@ -11,6 +12,10 @@ import pkg_resources
 from ophiuchus.cli.subcommands import EntryPointBuilderSubcommand
 from ophiuchus.framework import GlobalConfig
 from ophiuchus.framework import Handler
+from ophiuchus.manifest import build_manifest
+from ophiuchus.manifest import get_handler_methods
+from ophiuchus.manifest import MANIFEST_FILE_NAME
+from ophiuchus.manifest import write_manifest
 from ophiuchus.utils import load_entry_points
 from pip import main as pip
 
@@ -107,12 +112,17 @@ class Build(EntryPointBuilderSubcommand):
             requirements_file=requirements_file,
         )
 
-        self.build_lambdas(
+        handlers = self.build_lambdas(
             site_group=site_group,
             site_group_lambda_dir=site_group_lambda_dir,
             site_group_packages_dir=site_group_packages_dir,
         )
 
+        write_manifest(
+            os.path.join(site_group_artifact_dir, MANIFEST_FILE_NAME),
+            build_manifest(site_group, handlers),
+        )
+
     def install_package(
         self,
         site_group_packages_dir: str,
@@ -142,7 +152,7 @@ class Build(EntryPointBuilderSubcommand):
         site_group: str,
         site_group_lambda_dir: str,
         site_group_packages_dir: str,
-    ):
+    ) -> Dict[str, type]:
         self.log.debug("Creating site group lambda directory")
         os.makedirs(site_group_lambda_dir, exist_ok=True)
 
@@ -154,11 +164,16 @@ class Build(EntryPointBuilderSubcommand):
             loader=jinja2.PackageLoader("ophiuchus", "templates"),
         )
         template = env.get_template("lambdas/handler.py.template")
-        for name, ep in load_entry_points(
-            site_group, Handler, working_set,
-        ).items():
+        handlers = load_entry_points(site_group, Handler, working_set)
+        for name, ep in handlers.items():
             file_name = os.path.join(site_group_lambda_dir, f"{name}.py")
             with open(file_name, "w") as f:
                 f.write(
-                    template.render(module=ep.__module__, name=ep.__name__),
+                    template.render(
+                        module=ep.__module__,
+                        name=ep.__name__,
+                        methods=get_handler_methods(ep),
+                    ),
                 )
+
+        return handlers
@@ -1,15 +1,23 @@
 import asyncio
 import itertools
 import logging
+import os
 import re
 from argparse import ArgumentParser
+from os.path import abspath
 from typing import List
+from typing import Optional
 
 from aiohttp import web
 from ophiuchus.cli.subcommands import EntryPointBuilderSubcommand
 from ophiuchus.framework import GlobalConfig
 from ophiuchus.framework import Handler
+from ophiuchus.framework import HTTP_VERBS
 from ophiuchus.framework import routes
+from ophiuchus.manifest import get_handler_name
+from ophiuchus.manifest import load_manifest
+from ophiuchus.manifest import load_manifest_handlers
+from ophiuchus.manifest import MANIFEST_FILE_NAME
 from ophiuchus.utils import load_entry_points
 
 
@@ -77,26 +85,39 @@ async def start_site(
     address: str = "127.0.0.1",
     port: int = 3000,
     allow_unsupported_routes: bool = False,
+    manifest_dir: Optional[str] = None,
 ):
     web_app = web.Application()
 
-    for handler_name, handler_class in load_entry_points(
-        site_group, Handler,
-    ).items():
+    manifest_path = None
+    if manifest_dir:
+        manifest_path = os.path.join(
+            manifest_dir, site_group, MANIFEST_FILE_NAME,
+        )
+
+    if manifest_path and os.path.isfile(manifest_path):
+        manifest = load_manifest(manifest_path)
+        handler_classes = load_manifest_handlers(manifest)
+        handler_routes = {
+            name: details["routes"]
+            for name, details in manifest["handlers"].items()
+        }
+    else:
+        if manifest_path:
+            log.warning(
+                f"No manifest found at {manifest_path}, falling back to "
+                "entry points",
+            )
+        handler_classes = load_entry_points(site_group, Handler)
+        handler_routes = {
+            name: routes[get_handler_name(handler_class)]
+            for name, handler_class in handler_classes.items()
+        }
+
+    for handler_name, handler_class in handler_classes.items():
         handler = handler_class(config)
         for route, verb in itertools.product(
-            routes[f"{handler_class.__module__}.{handler_class.__name__}"],
-            [
-                "GET",
-                "HEAD",
-                "POST",
-                "PUT",
-                "DELETE",
-                "CONNECT",
-                "OPTIONS",
-                "TRACE",
-                "PATCH",
-            ],
+            handler_routes[handler_name], HTTP_VERBS,
         ):
             if not hasattr(handler, verb) or not callable(
                 getattr(handler, verb),
@@ -170,6 +191,14 @@ class Run(EntryPointBuilderSubcommand):
             "API Gateway. Potentially unsafe and not recommended. Only use "
             "this if you really know what you're doing",
         )
+        parser.add_argument(
+            "--manifest-dir",
+            default=None,
+            type=abspath,
+            help="Build artifacts directory containing site group manifests. "
+            "When a manifest exists for a site group, handlers are loaded "
+            "from it instead of scanning entry points",
+        )
 
     def __call__(
         self,
@@ -177,6 +206,7 @@ class Run(EntryPointBuilderSubcommand):
         listen_address: str,
         first_listen_port: List[int],
         allow_unsupported_routes: bool,
+        manifest_dir: Optional[str] = None,
         additional_endpoints: List[List[str]] = [],
         *args,
         **kwargs,
@@ -194,6 +224,7 @@ class Run(EntryPointBuilderSubcommand):
                     address=listen_address,
                     port=port,
                     allow_unsupported_routes=allow_unsupported_routes,
+                    manifest_dir=manifest_dir,
                 ),
             )
             config.add_endpoint(site_group, f"http://{listen_address}:{port}")
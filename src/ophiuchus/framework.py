@@ -8,6 +8,18 @@ log = logging.getLogger(__name__)
 
 routes = {}
 
+HTTP_VERBS = [
+    "GET",
+    "HEAD",
+    "POST",
+    "PUT",
+    "DELETE",
+    "CONNECT",
+    "OPTIONS",
+    "TRACE",
+    "PATCH",
+]
+
 
 class GlobalConfig:
     def __init__(self, endpoints: Dict[str, str] = {}, **kwargs):
@@ -0,0 +1,124 @@
+import hashlib
+import importlib
+import importlib.util
+import json
+import logging
+import os
+from typing import Any
+from typing import Dict
+from typing import Optional
+
+from ophiuchus.framework import Handler
+from ophiuchus.framework import HTTP_VERBS
+from ophiuchus.framework import routes
+
+
+log = logging.getLogger(__name__)
+
+MANIFEST_FILE_NAME = "manifest.json"
+MANIFEST_VERSION = 1
+
+
+def get_handler_name(handler: type) -> str:
+    return f"{handler.__module__}.{handler.__name__}"
+
+
+def get_handler_methods(handler: type) -> list:
+    return [
+        verb
+        for verb in HTTP_VERBS
+        if hasattr(handler, verb) and callable(getattr(handler, verb))
+    ]
+
+
+def hash_module(module: str) -> Optional[str]:
+    # Locate the module source without importing it, so stale manifest checks
+    # stay cheap at startup.
+    try:
+        spec = importlib.util.find_spec(module)
+    except (ImportError, ValueError) as e:
+        log.warning(f'Unable to locate module "{module}": {e}')
+        return None
+
+    if spec is None or not spec.origin or not os.path.isfile(spec.origin):
+        log.warning(f'Unable to locate source for module "{module}"')
+        return None
+
+    with open(spec.origin, "rb") as f:
+        return hashlib.sha256(f.read()).hexdigest()
+
+
+def build_manifest(
+    site_group: str, handlers: Dict[str, type],
+) -> Dict[str, Any]:
+    log.info(f"Building manifest for {site_group}")
+
+    manifest_handlers = {}
+    for name, handler in handlers.items():
+        log.debug(f'Adding "{name}" to {site_group} manifest')
+        manifest_handlers[name] = {
+            "module": handler.__module__,
+            "class": handler.__name__,
+            "routes": list(routes.get(get_handler_name(handler), [])),
+            "methods": get_handler_methods(handler),
+            "sha256": hash_module(handler.__module__),
+        }
+
+    return {
+        "version": MANIFEST_VERSION,
+        "site_group": site_group,
+        "handlers": manifest_handlers,
+    }
+
+
+def write_manifest(path: str, manifest: Dict[str, Any]) -> None:
+    log.info(f"Writing manifest to {path}")
+    with open(path, "w") as f:
+        json.dump(manifest, f, indent=2, sort_keys=True)
+
+
+def load_manifest(path: str) -> Dict[str, Any]:
+    log.info(f"Loading manifest from {path}")
+    with open(path) as f:
+        manifest = json.load(f)
+
+    if manifest.get("version") != MANIFEST_VERSION:
+        msg = (
+            f'Unsupported manifest version "{manifest.get("version")}" in '
+            f"{path}, expected {MANIFEST_VERSION}"
+        )
+        log.error(msg)
+        raise ValueError(msg)
+
+    return manifest
+
+
+def load_manifest_handlers(manifest: Dict[str, Any]) -> Dict[str, type]:
+    handlers = {}
+    site_group = manifest.get("site_group")
+
+    for name, details in manifest.get("handlers", {}).items():
+        module = details["module"]
+        log.debug(f'Loading "{name}" for {site_group} from "{module}"')
+
+        if details.get("sha256") and hash_module(module) != details["sha256"]:
+            log.warning(
+                f'Module "{module}" has changed since the {site_group} '
+                "manifest was built. Consider rebuilding.",
+            )
+
+        loaded = getattr(importlib.import_module(module), details["class"])
+
+        if not issubclass(loaded, Handler):
+            msg = (
+                f'Manifest entry "{name}" from "{site_group}" does not match '
+                f'type constraint for "{Handler.__module__}.'
+                f'{Handler.__name__}".'
+            )
+            log.error(msg)
+            raise TypeError(msg)
+
+        handlers[name] = loaded
+
+    log.debug(f"Finished loading {len(handlers)} from {site_group} manifest")
+    return handlers